@@ -101,15 +101,21 @@ function fail(
 function parseFrontmatter(
   content: string,
 ): { fm: Record<string, string>; endIdx: number } | null {
-  const lines = content.split("\n");
-  if (!lines.length || lines[0].trim() !== "---") return null;
-
+  const fmLines: string[] = [];
   let endIdx: number | null = null;
-  for (let i = 1; i < lines.length; i++) {
-    if (lines[i].trim() === "---") {
+  let start = 0;
+  for (let i = 0; endIdx === null; i++) {
+    const newline = content.indexOf("\n", start);
+    const line = content.slice(start, newline === -1 ? content.length : newline);
+    if (i === 0) {
+      if (line.trim() !== "---") return null;
+    } else if (line.trim() === "---") {
       endIdx = i;
-      break;
+    } else {
+      fmLines.push(line);
     }
+    if (newline === -1) break;
+    start = newline + 1;
   }
   if (endIdx === null) return null;
 
@@ -117,7 +123,7 @@ function parseFrontmatter(
   let currentKey = "";
   let currentValue = "";
 
-  for (const line of lines.slice(1, endIdx)) {
+  for (const line of fmLines) {
     const stripped = line.trim();
     if (!stripped || stripped.startsWith("#")) continue;
 
@@ -152,6 +158,12 @@ function parseFrontmatter(
   return { fm, endIdx };
 }
 
+function countLines(content: string): number {
+  let count = 1;
+  for (let i = content.indexOf("\n"); i !== -1; i = content.indexOf("\n", i + 1)) count++;
+  return count;
+}
+
 function stripYamlQuotes(value: string): string {
   if (
     (value.startsWith('"') && value.endsWith('"')) ||
@@ -227,12 +239,11 @@ async function main() {
   // ── Parse and validate SKILL.md ──
 
   const content = readFileSync(skillMdPath, "utf-8");
-  const lines = content.split("\n");
 
   // Frontmatter parsing
   const parsed = parseFrontmatter(content);
   if (!parsed) {
-    if (lines[0]?.trim() !== "---") {
+    if (content.split("\n", 1)[0].trim() !== "---") {
       fail(results, "frontmatter", "SKILL.md missing YAML frontmatter (must start with ---)");
     } else {
       fail(results, "frontmatter", "SKILL.md frontmatter not closed (missing closing ---)");
@@ -353,7 +364,7 @@ async function main() {
   }
 
   // Line count
-  const lineCount = lines.length;
+  const lineCount = countLines(content);
   if (lineCount > MAX_LINE_COUNT) {
     fail(
       results,
@@ -9,6 +9,19 @@ const EXCLUDE_GLOBS = new Set(["*.pyc"]);
 const EXCLUDE_FILES = new Set([".DS_Store"]);
 const ROOT_EXCLUDE_DIRS = new Set(["evals"]);
 
+// Convert glob pattern to regex: *.pyc -> .*\.pyc
+function globToRegex(pattern: string): string {
+  return pattern
+    .replace(/[.+^${}()|[\]\\]/g, "\\$&")
+    .replace(/\*/g, ".*")
+    .replace(/\?/g, ".");
+}
+
+// All globs compiled once into a single alternation
+const EXCLUDE_GLOB_PATTERN = new RegExp(
+  `^(?:${[...EXCLUDE_GLOBS].map(globToRegex).join("|")})$`,
+);
+
 function shouldExclude(relPath: string, skillDirName: string): boolean {
   const parts = relPath.split("/");
   if (parts.some((p) => EXCLUDE_DIRS.has(p))) return true;
@@ -16,14 +29,7 @@ function shouldExclude(relPath: string, skillDirName: string): boolean {
   if (parts.length > 1 && ROOT_EXCLUDE_DIRS.has(parts[1])) return true;
   const name = basename(relPath);
   if (EXCLUDE_FILES.has(name)) return true;
-  return [...EXCLUDE_GLOBS].some((pattern) => {
-    // Convert glob pattern to regex: *.pyc -> /^.*\.pyc$/
-    const escaped = pattern
-      .replace(/[.+^${}()|[\]\\]/g, "\\$&")
-      .replace(/\*/g, ".*")
-      .replace(/\?/g, ".");
-    return new RegExp(`^${escaped}$`).test(name);
-  });
+  return EXCLUDE_GLOB_PATTERN.test(name);
 }
 
 function walkDir(dir: string): string[] {
@@ -90,7 +90,8 @@ export function validateSkill(
     return { valid: false, message: "Missing 'description' in frontmatter" };
   }
 
-  const name = frontmatter.name.replace(/^["']|["']$/g, "").trim();
+  // Matching quote pairs were already removed by stripQuotes
+  const name = frontmatter.name.trim();
   if (name) {
     if (!/^[a-z0-9-]+$/.test(name)) {
       return {
@@ -112,9 +113,7 @@ export function validateSkill(
     }
   }
 
-  const description = frontmatter.description
-    .replace(/^["']|["']$/g, "")
-    .trim();
+  const description = frontmatter.description.trim();
   if (description) {
     if (description.includes("<") || description.includes(">")) {
       return {
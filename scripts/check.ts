@@ -273,14 +273,41 @@ function flag(filePath: string, content: string): Flag[] {
 		});
 	}
 
+	// ── Line scan ──
+
+	const nestingFlags: Flag[] = [];
+	let descLineNum = 0;
+	let maxBlankRun = 0;
+	let currentBlank = 0;
+	for (let i = 0; i < lines.length; i++) {
+		const line = lines[i];
+
+		if (!descLineNum && line.startsWith("description:")) descLineNum = i + 1;
+
+		// Deep nesting (4+ levels of indentation in lists)
+		const match = line.match(/^(\s+)[-*\d]/);
+		if (match && match[1].length >= 8) {
+			nestingFlags.push({
+				file: rel,
+				line: i + 1,
+				severity: "warn",
+				message: `deep nesting (${Math.floor(match[1].length / 2)} levels) — harder for agents to parse`,
+			});
+		}
+
+		if (line.trim() === "") {
+			currentBlank++;
+			if (currentBlank > maxBlankRun) maxBlankRun = currentBlank;
+		} else {
+			currentBlank = 0;
+		}
+	}
+
 	// ── Frontmatter checks ──
 
 	const fm = parseFrontmatter(content);
 
 	if (isSkill) {
-		const descLineNum =
-			lines.findIndex((l) => l.startsWith("description:")) + 1;
-
 		if (!fm) {
 			flags.push({
 				file: rel,
@@ -313,18 +340,7 @@ function flag(filePath: string, content: string): Flag[] {
 
 	// ── Structural checks (all .md files) ──
 
-	// Deep nesting (4+ levels of indentation in lists)
-	for (let i = 0; i < lines.length; i++) {
-		const match = lines[i].match(/^(\s+)[-*\d]/);
-		if (match && match[1].length >= 8) {
-			flags.push({
-				file: rel,
-				line: i + 1,
-				severity: "warn",
-				message: `deep nesting (${Math.floor(match[1].length / 2)} levels) — harder for agents to parse`,
-			});
-		}
-	}
+	flags.push(...nestingFlags);
 
 	// Consecutive-blank bloat: the optimizer collapses 3+ blanks to 2 and
 	// strips blanks immediately after headings. Anything leftover is
@@ -333,16 +349,6 @@ function flag(filePath: string, content: string): Flag[] {
 	// be zero after --fix). This replaces the old blank-line-ratio heuristic
 	// that incorrectly penalized naturally concise reference prose.
 
-	let maxBlankRun = 0;
-	let currentBlank = 0;
-	for (const line of lines) {
-		if (line.trim() === "") {
-			currentBlank++;
-			if (currentBlank > maxBlankRun) maxBlankRun = currentBlank;
-		} else {
-			currentBlank = 0;
-		}
-	}
 	if (maxBlankRun >= 3) {
 		flags.push({
 			file: rel,
@@ -16,8 +16,8 @@
  *   - .agents/plugins/marketplace.json
  */
 
-import { existsSync } from "node:fs";
-import { mkdir, readFile, readdir, rm, writeFile } from "node:fs/promises";
+import { type Dirent, existsSync } from "node:fs";
+import { mkdir, open, readFile, readdir, rm, writeFile } from "node:fs/promises";
 import { basename, dirname, join, relative, resolve } from "node:path";
 
 const ROOT = resolve(import.meta.dir, "..");
@@ -29,6 +29,7 @@ const CODEX_MARKETPLACE_PATH = resolve(ROOT, ".agents/plugins/marketplace.json")
 const OBSOLETE_ROOT_CODEX_PLUGIN_DIR = resolve(ROOT, ".codex-plugin");
 const OBSOLETE_ROOT_SKILLS_DIR = resolve(ROOT, "skills");
 const write = process.argv.includes("--write");
+const KEBAB_CASE = /^[a-z0-9][a-z0-9-]*[a-z0-9]$/;
 
 const dim = (s: string) => `\x1b[2m${s}\x1b[0m`;
 const green = (s: string) => `\x1b[32m${s}\x1b[0m`;
@@ -88,17 +89,26 @@ function rel(path: string): string {
 }
 
 async function readJson<T>(path: string): Promise<T> {
-	return JSON.parse(await readFile(path, "utf-8")) as T;
+	return (await Bun.file(path).json()) as T;
+}
+
+async function readIfExists(path: string): Promise<string | null> {
+	try {
+		return await readFile(path, "utf-8");
+	} catch (error) {
+		if ((error as NodeJS.ErrnoException).code === "ENOENT") return null;
+		throw error;
+	}
 }
 
 async function writeIfChanged(path: string, content: string): Promise<void> {
-	const oldContent = existsSync(path) ? await readFile(path, "utf-8") : "";
+	const oldContent = await readIfExists(path);
 	if (oldContent === content) return;
 
-	changes.push({ path: rel(path), reason: existsSync(path) ? "changed" : "new" });
+	changes.push({ path: rel(path), reason: oldContent === null ? "new" : "changed" });
 	if (!write) return;
 
-	await mkdir(dirname(path), { recursive: true });
+	if (oldContent === null) await mkdir(dirname(path), { recursive: true });
 	await writeFile(path, content);
 }
 
@@ -109,6 +119,15 @@ async function removeIfExists(path: string, reason: string): Promise<void> {
 	if (write) await rm(path, { recursive: true, force: true });
 }
 
+async function readDirEntries(path: string): Promise<Dirent[]> {
+	try {
+		return await readdir(path, { withFileTypes: true });
+	} catch (error) {
+		if ((error as NodeJS.ErrnoException).code === "ENOENT") return [];
+		throw error;
+	}
+}
+
 function pluginRoot(group: PluginGroup): string {
 	return resolve(PLUGINS_DIR, group.name);
 }
@@ -121,57 +140,111 @@ function skillLabel(group: PluginGroup, skill: string): string {
 	return `plugins/${group.name}/skills/${skill}`;
 }
 
+const FENCE = Buffer.from("---");
+const FRONTMATTER_READ_BYTES = 16 * 1024;
+const FRONTMATTER = /^---\r?\n([\s\S]*?)\r?\n---/;
+const FRONTMATTER_FIELD = /^(\w[\w-]*):\s*(.*)$/;
+const BLOCK_SCALAR = /^[>|][+-]?$/;
+
+function stripQuotes(value: string): string {
+	if (
+		(value.startsWith("\"") && value.endsWith("\"")) ||
+		(value.startsWith("'") && value.endsWith("'"))
+	) {
+		return value.slice(1, -1);
+	}
+	return value;
+}
+
+function startsWithFence(raw: Buffer): boolean {
+	return raw.subarray(0, FENCE.length).equals(FENCE);
+}
+
+function frontmatterEnd(raw: Buffer): number {
+	if (!startsWithFence(raw)) return -1;
+	const openingEnd = raw.indexOf("\n");
+	if (openingEnd === -1) return -1;
+	const closing = raw.indexOf("\n---", openingEnd + 1);
+	return closing === -1 ? -1 : closing + 1 + FENCE.length;
+}
+
+async function readHead(path: string, bytes: number): Promise<Buffer> {
+	const handle = await open(path, "r");
+	try {
+		const buffer = Buffer.allocUnsafe(bytes);
+		const { bytesRead } = await handle.read(buffer, 0, bytes, 0);
+		return buffer.subarray(0, bytesRead);
+	} finally {
+		await handle.close();
+	}
+}
+
+/**
+ * Reads top-level scalar fields. Indented lines continue the previous value
+ * only when it is a block scalar (`>`, `|-`, …) or a plain scalar; keys with
+ * an empty value (nested maps/lists such as `metadata:`) come back as "".
+ */
 function parseFrontmatter(content: string): Record<string, string> | null {
-	const match = content.match(/^---\n([\s\S]*?)\n---/);
+	const match = FRONTMATTER.exec(content);
 	if (!match) return null;
 
 	const fields: Record<string, string> = {};
-	for (const line of match[1].split("\n")) {
-		const parts = line.match(/^(\w[\w-]*):\s*(.*)$/);
-		if (!parts) continue;
-		let value = parts[2].trim();
-		if (
-			(value.startsWith("\"") && value.endsWith("\"")) ||
-			(value.startsWith("'") && value.endsWith("'"))
-		) {
-			value = value.slice(1, -1);
+	let currentKey = "";
+	let currentValue = "";
+	let folding = false;
+	for (const line of match[1].split(/\r?\n/)) {
+		const parts = FRONTMATTER_FIELD.exec(line);
+		if (parts) {
+			if (currentKey) fields[currentKey] = stripQuotes(currentValue.trim());
+			currentKey = parts[1];
+			const value = parts[2].trim();
+			const blockScalar = BLOCK_SCALAR.test(value);
+			folding = blockScalar || value !== "";
+			currentValue = blockScalar ? "" : value;
+		} else if (folding && (line.startsWith("  ") || line.startsWith("\t"))) {
+			currentValue += ` ${line.trim()}`;
 		}
-		fields[parts[1]] = value;
 	}
+	if (currentKey) fields[currentKey] = stripQuotes(currentValue.trim());
 	return fields;
 }
 
-async function validateSkill(group: PluginGroup, skill: string): Promise<void> {
+async function validateSkill(group: PluginGroup, skill: string, skillDirs: Set<string>): Promise<string[]> {
 	const dir = skillDir(group, skill);
 	const skillPath = resolve(dir, "SKILL.md");
 
-	if (!existsSync(dir)) {
-		errors.push(`plugin "${group.name}" references missing skill "${skill}" at ${skillLabel(group, skill)}`);
-		return;
+	if (!skillDirs.has(skill) && !existsSync(dir)) {
+		return [`plugin "${group.name}" references missing skill "${skill}" at ${skillLabel(group, skill)}`];
 	}
 	if (!existsSync(skillPath)) {
-		errors.push(`${skillLabel(group, skill)} has no SKILL.md`);
-		return;
+		return [`${skillLabel(group, skill)} has no SKILL.md`];
 	}
 
-	const content = await readFile(skillPath, "utf-8");
-	const fm = parseFrontmatter(content);
+	let raw = await readHead(skillPath, FRONTMATTER_READ_BYTES);
+	let closing = frontmatterEnd(raw);
+	if (closing === -1 && raw.length === FRONTMATTER_READ_BYTES && startsWithFence(raw)) {
+		raw = await readFile(skillPath);
+		closing = frontmatterEnd(raw);
+	}
+	const fm = closing === -1 ? null : parseFrontmatter(raw.toString("utf-8", 0, closing));
 	if (!fm) {
-		errors.push(`${skillLabel(group, skill)}/SKILL.md has no YAML frontmatter`);
-		return;
+		return [`${skillLabel(group, skill)}/SKILL.md has no YAML frontmatter`];
 	}
+
+	const skillErrors: string[] = [];
 	if (fm.name && fm.name !== skill) {
-		errors.push(`${skillLabel(group, skill)}/SKILL.md name "${fm.name}" does not match directory`);
+		skillErrors.push(`${skillLabel(group, skill)}/SKILL.md name "${fm.name}" does not match directory`);
 	}
 	if (!fm.description) {
-		errors.push(`${skillLabel(group, skill)}/SKILL.md is missing description`);
+		skillErrors.push(`${skillLabel(group, skill)}/SKILL.md is missing description`);
 	} else if (fm.description.length > 1024) {
-		errors.push(`${skillLabel(group, skill)}/SKILL.md description exceeds 1024 characters`);
+		skillErrors.push(`${skillLabel(group, skill)}/SKILL.md description exceeds 1024 characters`);
 	}
+	return skillErrors;
 }
 
 async function validateGroups(groups: PluginGroups): Promise<void> {
-	if (!groups.name || !/^[a-z0-9][a-z0-9-]*[a-z0-9]$/.test(groups.name)) {
+	if (!groups.name || !KEBAB_CASE.test(groups.name)) {
 		errors.push("plugin-groups.json marketplace name must be kebab-case");
 	}
 	if (!groups.owner?.name) errors.push("plugin-groups.json owner.name is required");
@@ -183,7 +256,7 @@ async function validateGroups(groups: PluginGroups): Promise<void> {
 	const seenPlugins = new Set<string>();
 	const skillOwners = new Map<string, string>();
 	for (const group of groups.plugins) {
-		if (!/^[a-z0-9][a-z0-9-]*[a-z0-9]$/.test(group.name)) {
+		if (!KEBAB_CASE.test(group.name)) {
 			errors.push(`plugin "${group.name}" must use kebab-case`);
 		}
 		if (seenPlugins.has(group.name)) errors.push(`duplicate plugin "${group.name}"`);
@@ -198,30 +271,34 @@ async function validateGroups(groups: PluginGroups): Promise<void> {
 			errors.push(`plugin "${group.name}" readmeBody file is missing: ${group.readmeBody}`);
 		}
 
+		const skillsRoot = resolve(pluginRoot(group), "skills");
+		const skillDirs = new Set<string>();
+		for (const entry of await readDirEntries(skillsRoot)) {
+			if (entry.isDirectory()) skillDirs.add(entry.name);
+		}
+
+		const pendingSkills: Promise<string[]>[] = [];
 		const localSeenSkills = new Set<string>();
 		for (const skill of group.skills) {
 			if (localSeenSkills.has(skill)) errors.push(`plugin "${group.name}" lists skill "${skill}" twice`);
 			localSeenSkills.add(skill);
 
 			const existingOwner = skillOwners.get(skill);
-			if (existingOwner && existingOwner !== group.name) {
+			if (existingOwner === undefined) {
+				skillOwners.set(skill, group.name);
+			} else if (existingOwner !== group.name) {
 				errors.push(
 					`skill "${skill}" is listed in both "${existingOwner}" and "${group.name}"; each skill needs one owning plugin`,
 				);
-			} else {
-				skillOwners.set(skill, group.name);
 			}
 
-			await validateSkill(group, skill);
+			pendingSkills.push(validateSkill(group, skill, skillDirs));
 		}
+		for (const skillErrors of await Promise.all(pendingSkills)) errors.push(...skillErrors);
 
-		const skillsRoot = resolve(pluginRoot(group), "skills");
-		if (existsSync(skillsRoot)) {
-			const entries = await readdir(skillsRoot, { withFileTypes: true });
-			for (const entry of entries) {
-				if (entry.isDirectory() && !localSeenSkills.has(entry.name)) {
-					errors.push(`${rel(resolve(skillsRoot, entry.name))} exists but is not listed in plugin-groups.json`);
-				}
+		for (const name of skillDirs) {
+			if (!localSeenSkills.has(name)) {
+				errors.push(`${rel(resolve(skillsRoot, name))} exists but is not listed in plugin-groups.json`);
 			}
 		}
 
@@ -233,15 +310,12 @@ async function validateGroups(groups: PluginGroups): Promise<void> {
 		}
 	}
 
-	if (existsSync(PLUGINS_DIR)) {
-		const pluginDirs = await readdir(PLUGINS_DIR, { withFileTypes: true });
-		for (const entry of pluginDirs) {
-			if (!entry.isDirectory()) continue;
-			if (seenPlugins.has(entry.name)) continue;
-			const skillsRoot = resolve(PLUGINS_DIR, entry.name, "skills");
-			if (existsSync(skillsRoot)) {
-				errors.push(`plugins/${entry.name}/skills exists but "${entry.name}" is not listed in plugin-groups.json`);
-			}
+	for (const entry of await readDirEntries(PLUGINS_DIR)) {
+		if (!entry.isDirectory()) continue;
+		if (seenPlugins.has(entry.name)) continue;
+		const skillsRoot = resolve(PLUGINS_DIR, entry.name, "skills");
+		if (existsSync(skillsRoot)) {
+			errors.push(`plugins/${entry.name}/skills exists but "${entry.name}" is not listed in plugin-groups.json`);
 		}
 	}
 }
@@ -485,9 +559,8 @@ async function walkMarkdown(root: string): Promise<string[]> {
 async function failIfErrors(): Promise<void> {
 	if (errors.length === 0) return;
 
-	console.log("");
-	console.log(bold(red("Validation errors:")));
-	for (const error of errors) console.log(`  ${red("ERR")} ${error}`);
+	const lines = errors.map((error) => `  ${red("ERR")} ${error}`);
+	console.log(`\n${bold(red("Validation errors:"))}\n${lines.join("\n")}`);
 	process.exit(1);
 }
 
@@ -531,7 +604,7 @@ async function main() {
 	await writeIfChanged(CURSOR_MARKETPLACE_PATH, json(cursorMarketplace(groups)));
 	await writeIfChanged(CODEX_MARKETPLACE_PATH, json(codexMarketplace(groups)));
 
-	if (write || changes.length === 0) {
+	if (write && changes.length > 0) {
 		await validateRelativeRefs(PLUGINS_DIR, "plugins");
 		await failIfErrors();
 	}
@@ -542,9 +615,8 @@ async function main() {
 		return;
 	}
 
-	for (const change of changes) {
-		console.log(`  ${write ? green("updated") : yellow("changed")}  ${change.path}  ${dim(change.reason)}`);
-	}
+	const label = write ? green("updated") : yellow("changed");
+	console.log(changes.map((change) => `  ${label}  ${change.path}  ${dim(change.reason)}`).join("\n"));
 
 	console.log("");
 	if (write) {
@@ -203,9 +203,12 @@ async function validateComponentFrontmatter(pluginDir: string, pluginName: strin
 	}
 }
 
-function resolveMarketplaceSource(source: string, pluginRoot: string | undefined): string {
-	if (!pluginRoot) return source;
-	const normalizedRoot = pluginRoot.replace(/\\/g, "/").replace(/\/+$/, "");
+function normalizePluginRoot(pluginRoot: unknown): string {
+	return typeof pluginRoot === "string" ? pluginRoot.replace(/\\/g, "/").replace(/\/+$/, "") : "";
+}
+
+function resolveMarketplaceSource(source: string, normalizedRoot: string): string {
+	if (!normalizedRoot) return source;
 	const normalizedSource = source.replace(/\\/g, "/");
 	if (normalizedSource === normalizedRoot || normalizedSource.startsWith(`${normalizedRoot}/`)) {
 		return normalizedSource;
@@ -277,6 +280,7 @@ async function main(): Promise<void> {
 		addError('Marketplace "metadata.pluginRoot" is required (use "plugins").');
 	}
 
+	const normalizedRoot = normalizePluginRoot(pluginRoot);
 	const seenNames = new Set<string>();
 	for (const [index, entry] of marketplace.plugins.entries()) {
 		const label = `plugins[${index}]`;
@@ -296,7 +300,7 @@ async function main(): Promise<void> {
 		}
 		seenNames.add(entry.name);
 
-		const sourcePath = resolveMarketplaceSource(entry.source ?? "", pluginRoot ?? "");
+		const sourcePath = resolveMarketplaceSource(entry.source ?? "", normalizedRoot);
 		if (!sourcePath) {
 			addError(`${label}.source must be a string path.`);
 			continue;